@@ -0,0 +1,24 @@
+import sys
+import orjson
+from main import COLD_LOG_FILE, COLD_RECORD, DERIVATION_PATH, MNEMO, base58_encode
+
+def dump_cold_log(path):
+    """Print binary cold log records as JSON lines"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # Ignore a trailing partial record left by an interrupted write
+    usable = len(data) - len(data) % COLD_RECORD.size
+    for ts, address, private_key, entropy, index, has_balance in COLD_RECORD.iter_unpack(data[:usable]):
+        record = {
+            "ts": ts,
+            "address": base58_encode(address),
+            "phrase": MNEMO.to_mnemonic(entropy),
+            "private_key": private_key.hex(),
+            "path": f"{DERIVATION_PATH}/{index}",
+            "has_balance": bool(has_balance)
+        }
+        sys.stdout.buffer.write(orjson.dumps(record) + b"\n")
+
+if __name__ == "__main__":
+    dump_cold_log(sys.argv[1] if len(sys.argv) > 1 else COLD_LOG_FILE)
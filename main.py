@@ -1,21 +1,86 @@
 import os
 import sys
 import time
-import json
-import requests
+import orjson
+import atexit
+import signal
+import hmac
+import struct
+import hashlib
+import secrets
+import asyncio
+import aiohttp
+import multiprocessing
 from datetime import datetime
 from mnemonic import Mnemonic
-from hdwallet import HDWallet
-from hdwallet.symbols import BTC
+from coincurve import PublicKey
+import based58
+from rbloom import Bloom
 import itertools
 
-DERIVATION_PATH = "m/44'/0'/0'/0/0"
-BALANCE_CHECK_INTERVAL = 1  # seconds between API calls
+DERIVATION_PATH = "m/44'/0'/0'/0"  # BIP44 receive chain, addresses are its children
+ADDRESSES_PER_MNEMONIC = 20  # receive addresses checked per mnemonic (wallet gap limit)
+HARDENED = 0x80000000
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+SECP256K1_G = bytes.fromhex("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+P2PKH_VERSION = b"\x00"
+MNEMO = Mnemonic("english")
+WORDLIST = [word.encode("ascii") for word in MNEMO.wordlist]  # pre-encoded for PBKDF2 input
+BATCH_API_RATE = 0.1  # blockchain.info batch calls per second
+BATCH_API_BURST = 3  # blockchain.info calls allowed back to back
+BLOCKCYPHER_RATE = 3  # blockcypher calls per second
+BLOCKCYPHER_BURST = 10  # blockcypher calls allowed back to back
+MEMPOOL_RATE = 1  # mempool.space calls per second
+MEMPOOL_BURST = 5  # mempool.space calls allowed back to back
+BALANCE_BATCH_SIZE = 50  # addresses per multi-address API call
 BALANCE_RETRY_DELAY = 5  # seconds to wait on error
 MAX_RETRIES = 3  # maximum number of retries for balance check
+BALANCE_CONCURRENCY = 8  # balance lookups in flight at once
+WORKER_COUNT = os.cpu_count() or 1  # address generation processes
+WORKER_POLL_TIMEOUT = 1  # seconds to block waiting on a worker result
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+HTTP_POOL_SIZE = 32  # keep-alive connections shared by all API calls
+HTTP_POOL_PER_HOST = 16  # connections per API provider
+HTTP_KEEPALIVE_TIMEOUT = 60  # seconds an idle connection is kept open
+STATUS_INTERVAL = 0.1  # seconds between progress line redraws
 FOUND_ADDRESSES_FILE = "found_addresses.txt"
 ERROR_LOG_FILE = "errors.log"
-COLD_LOG_FILE = "cold_log.jsonl"  # New file for cold logging
+COLD_LOG_FILE = "cold_log.bin"  # New file for cold logging
+# Cold log record: epoch, raw address, private key, mnemonic entropy, address index, has_balance
+COLD_RECORD = struct.Struct("<d25s32s16sHB")
+LOG_BUFFER_SIZE = 65536  # bytes buffered per log file before hitting disk
+FUNDED_ADDRESSES_FILE = "funded_addresses.txt"  # snapshot of addresses with nonzero balance, one per line
+FUNDED_FILTER_FPR = 1e-6  # bloom filter false positive rate
+
+# Log file handles, opened once per process by open_log_files()
+_error_fh = None
+_found_fh = None
+_cold_fh = None
+
+def open_log_files():
+    """Open buffered append handles for all log files, creating missing ones"""
+    global _error_fh, _found_fh, _cold_fh
+    _error_fh = open(ERROR_LOG_FILE, "ab", buffering=LOG_BUFFER_SIZE)
+    _found_fh = open(FOUND_ADDRESSES_FILE, "ab", buffering=LOG_BUFFER_SIZE)
+    _cold_fh = open(COLD_LOG_FILE, "ab", buffering=LOG_BUFFER_SIZE)
+    atexit.register(close_log_files)
+
+def shard_path(path, pid):
+    """Per-process shard of a log file, e.g. errors.1234.log"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{pid}{ext}"
+
+def close_log_files():
+    """Flush and close log file handles"""
+    for fh in (_error_fh, _found_fh, _cold_fh):
+        if fh is not None and not fh.closed:
+            fh.close()
+
+def flush_logs_and_exit(signum, frame):
+    """SIGTERM handler: write out buffered logs, then terminate as usual"""
+    close_log_files()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
 
 def log_error(error_type, details, wallet_info=None):
     """Log errors to file with timestamp and wallet info"""
@@ -30,100 +95,290 @@ def log_error(error_type, details, wallet_info=None):
     if wallet_info:
         error_data.update(wallet_info)
     
-    with open(ERROR_LOG_FILE, "a") as f:
-        f.write(json.dumps(error_data) + "\n")
-        f.flush()
+    _error_fh.write(orjson.dumps(error_data) + b"\n")
 
-def check_balance(address, retry_count=0, wallet_info=None):
-    """Check address balance with retry logic"""
-    if retry_count >= MAX_RETRIES:
-        log_error("MAX_RETRIES_EXCEEDED", "Maximum retries exceeded", wallet_info)
-        return 0
+class TokenBucket:
+    """Async token bucket: sustained rate per second with a burst capacity"""
 
-    try:
-        url = f"https://api.blockcypher.com/v1/btc/main/addrs/{address}"
-        resp = requests.get(url, timeout=10)
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# One bucket per provider so fallback traffic doesn't eat the primary's quota
+BATCH_API_BUCKET = TokenBucket(BATCH_API_RATE, BATCH_API_BURST)
+BLOCKCYPHER_BUCKET = TokenBucket(BLOCKCYPHER_RATE, BLOCKCYPHER_BURST)
+MEMPOOL_BUCKET = TokenBucket(MEMPOOL_RATE, MEMPOOL_BURST)
+
+async def check_balance(session, address, wallet_info=None):
+    """Check address balance with retry logic"""
+    for retry_count in range(MAX_RETRIES):
+        # Exponential backoff between attempts
+        retry_delay = BALANCE_RETRY_DELAY * (2 ** retry_count)
         
-        if resp.status_code == 200:
-            try:
-                data = resp.json()
-                return data.get("final_balance", 0)
-            except json.JSONDecodeError:
-                log_error("JSON_DECODE_ERROR", "Failed to parse response as JSON", wallet_info)
-                time.sleep(BALANCE_RETRY_DELAY)
-                return check_balance(address, retry_count + 1, wallet_info)
+        try:
+            url = f"https://api.blockcypher.com/v1/btc/main/addrs/{address}"
+            await BLOCKCYPHER_BUCKET.acquire()
+            async with session.get(url) as resp:
+                status = resp.status
+                body = await resp.read()
+            
+            if status == 200:
+                try:
+                    data = orjson.loads(body)
+                    return data.get("final_balance", 0)
+                except orjson.JSONDecodeError:
+                    log_error("JSON_DECODE_ERROR", "Failed to parse response as JSON", wallet_info)
+                    
+            elif status == 429:  # Rate limit
+                # Try mempool.space API as fallback
+                try:
+                    url = f"https://mempool.space/api/address/{address}"
+                    await MEMPOOL_BUCKET.acquire()
+                    async with session.get(url) as resp:
+                        if resp.status == 200:
+                            data = orjson.loads(await resp.read())
+                            funded = data.get("chain_stats", {}).get("funded_txo_sum", 0)
+                            spent = data.get("chain_stats", {}).get("spent_txo_sum", 0)
+                            return funded - spent
+                except Exception as e:
+                    log_error("FALLBACK_API_ERROR", f"Error: {str(e)}", wallet_info)
+                
+                log_error("RATE_LIMIT", f"Status: {status}", wallet_info)
+                retry_delay = 185  # Wait longer on rate limit
+                
+            elif status == 404:
+                return 0
                 
-        elif resp.status_code == 429:  # Rate limit
-            # Try mempool.space API as fallback
-            try:
-                url = f"https://mempool.space/api/address/{address}"
-                resp = requests.get(url, timeout=10)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    funded = data.get("chain_stats", {}).get("funded_txo_sum", 0)
-                    spent = data.get("chain_stats", {}).get("spent_txo_sum", 0)
-                    return funded - spent
-            except Exception as e:
-                log_error("FALLBACK_API_ERROR", f"Error: {str(e)}", wallet_info)
+            elif status >= 500:
+                log_error("SERVER_ERROR", f"Status: {status}", wallet_info)
+                
+            else:
+                log_error("API_ERROR", f"Status: {status}", wallet_info)
+                
+        except asyncio.TimeoutError:
+            log_error("TIMEOUT", "Request timed out", wallet_info)
             
-            log_error("RATE_LIMIT", f"Status: {resp.status_code}", wallet_info)
-            time.sleep(185)  # Wait longer on rate limit
-            return check_balance(address, retry_count + 1, wallet_info)
+        except aiohttp.ClientConnectionError:
+            log_error("CONNECTION_ERROR", "Failed to connect to API", wallet_info)
             
-        elif resp.status_code == 404:
+        except Exception as e:
+            log_error("UNKNOWN_ERROR", f"Error: {str(e)}", wallet_info)
             return 0
-            
-        elif resp.status_code >= 500:
-            log_error("SERVER_ERROR", f"Status: {resp.status_code}", wallet_info)
-            time.sleep(BALANCE_RETRY_DELAY)
-            return check_balance(address, retry_count + 1, wallet_info)
-            
-        else:
-            log_error("API_ERROR", f"Status: {resp.status_code}", wallet_info)
-            time.sleep(BALANCE_RETRY_DELAY)
-            return check_balance(address, retry_count + 1, wallet_info)
-            
-    except requests.exceptions.Timeout:
-        log_error("TIMEOUT", "Request timed out", wallet_info)
-        time.sleep(BALANCE_RETRY_DELAY)
-        return check_balance(address, retry_count + 1, wallet_info)
-        
-    except requests.exceptions.ConnectionError:
-        log_error("CONNECTION_ERROR", "Failed to connect to API", wallet_info)
-        time.sleep(BALANCE_RETRY_DELAY)
-        return check_balance(address, retry_count + 1, wallet_info)
         
+        await asyncio.sleep(retry_delay)
+
+    log_error("MAX_RETRIES_EXCEEDED", "Maximum retries exceeded", wallet_info)
+    return 0
+
+async def check_balances(session, wallet_infos):
+    """Check balances for a batch of addresses with one multi-address API call"""
+    balances = {}
+    addresses = [wallet_info["address"] for wallet_info in wallet_infos]
+
+    try:
+        url = "https://blockchain.info/balance?active=" + "|".join(addresses)
+        await BATCH_API_BUCKET.acquire()
+        async with session.get(url) as resp:
+            status = resp.status
+            body = await resp.read()
+
+        if status == 200:
+            data = orjson.loads(body)
+            for address in addresses:
+                if address in data:
+                    balances[address] = data[address].get("final_balance", 0)
+        else:
+            log_error("BATCH_API_ERROR", f"Status: {status}")
+
+    except asyncio.TimeoutError:
+        log_error("BATCH_TIMEOUT", "Batch request timed out")
+    except aiohttp.ClientConnectionError:
+        log_error("BATCH_CONNECTION_ERROR", "Failed to connect to batch API")
     except Exception as e:
-        log_error("UNKNOWN_ERROR", f"Error: {str(e)}", wallet_info)
-        return 0
+        log_error("BATCH_UNKNOWN_ERROR", f"Error: {str(e)}")
+
+    # Fall back to per-address checks for anything the batch call missed
+    missing = [wallet_info for wallet_info in wallet_infos if wallet_info["address"] not in balances]
+    results = await asyncio.gather(*(
+        check_balance(session, wallet_info["address"], wallet_info=wallet_info)
+        for wallet_info in missing
+    ))
+    for wallet_info, balance in zip(missing, results):
+        balances[wallet_info["address"]] = balance
 
-def save_found_address(address, balance, phrase=None, private_key=None):
+    return balances
+
+def load_funded_filter():
+    """Build a bloom filter from the funded addresses snapshot, None if missing"""
+    if not os.path.exists(FUNDED_ADDRESSES_FILE):
+        return None
+
+    with open(FUNDED_ADDRESSES_FILE) as f:
+        count = sum(1 for _ in f)
+
+    bloom = Bloom(max(count, 1), FUNDED_FILTER_FPR)
+    with open(FUNDED_ADDRESSES_FILE) as f:
+        # Snapshot lines may carry extra columns (e.g. balance) after the address
+        bloom.update(line.split()[0] for line in f if line.strip())
+    return bloom
+
+def save_found_address(address, balance, phrase=None, private_key=None, path=None):
     """Save found address with balance to file"""
     try:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(FOUND_ADDRESSES_FILE, "a") as f:
-            data = {
-                "timestamp": timestamp,
-                "address": address,
-                "balance": balance,
-                "phrase": phrase,
-                "private_key": private_key
-            }
-            f.write(json.dumps(data) + "\n")
-            f.flush()  # Ensure immediate write
+        data = {
+            "timestamp": timestamp,
+            "address": address,
+            "balance": balance,
+            "phrase": phrase,
+            "private_key": private_key,
+            "path": path
+        }
+        _found_fh.write(orjson.dumps(data) + b"\n")
+        
+        # Found addresses must survive a crash, so push everything to disk
+        _cold_fh.flush()
+        _error_fh.flush()
+        _found_fh.flush()
+        os.fsync(_found_fh.fileno())
     except Exception as e:
         log_error("SAVE_ERROR", f"Failed to save address {address}: {str(e)}")
 
-def generate_address_from_phrase(phrase):
-    """Generate Bitcoin address and private key from mnemonic phrase"""
+def parse_derivation_path(path):
+    """Parse BIP32 path like m/44'/0'/0'/0/0 into child indexes"""
+    indexes = []
+    for part in path.split("/")[1:]:
+        if part.endswith("'"):
+            indexes.append(int(part[:-1]) + HARDENED)
+        else:
+            indexes.append(int(part))
+    return indexes
+
+# Derivation state built once per process and reused for every candidate:
+# serialized child indexes, and whether each step needs the parent public key
+# (only non-hardened children use it as CKDpriv input)
+DERIVATION_STEPS = [
+    (index.to_bytes(4, "big"), index < HARDENED)
+    for index in parse_derivation_path(DERIVATION_PATH)
+]
+MASTER_HMAC = hmac.new(b"Bitcoin seed", digestmod=hashlib.sha512)
+ADDRESS_INDEX_BYTES = [index.to_bytes(4, "big") for index in range(ADDRESSES_PER_MNEMONIC)]
+RIPEMD160 = hashlib.new("ripemd160")
+
+def base58_encode(data):
+    """Encode raw bytes as Base58 string"""
+    return based58.b58encode(data).decode()
+
+def base58_decode(encoded):
+    """Decode Base58 string back to raw bytes"""
+    return based58.b58decode(encoded.encode())
+
+def base58check_encode(payload):
+    """Encode payload as Base58Check string"""
+    return based58.b58encode_check(payload).decode()
+
+def check_secp256k1_backend():
+    """Abort unless public keys are computed by libsecp256k1 through coincurve"""
+    try:
+        from coincurve._libsecp256k1 import lib  # noqa: F401
+    except ImportError as e:
+        raise SystemExit(f"coincurve is missing its libsecp256k1 binding: {e}")
+    
+    if PublicKey.from_secret((1).to_bytes(32, "big")).format(compressed=True) != SECP256K1_G:
+        raise SystemExit("coincurve self-check failed: 1*G is not the secp256k1 generator")
+
+def hash160(data):
+    """RIPEMD160(SHA256(data)) via OpenSSL, reusing a prepared RIPEMD160 context"""
+    ripemd = RIPEMD160.copy()
+    ripemd.update(hashlib.sha256(data).digest())
+    return ripemd.digest()
+
+def derive_p2pkh(mnemonic_bytes, passphrase=b""):
+    """Derive the first ADDRESSES_PER_MNEMONIC P2PKH addresses and private keys (hex) from mnemonic bytes"""
+    seed = hashlib.pbkdf2_hmac("sha512", mnemonic_bytes, b"mnemonic" + passphrase, 2048, 64)
+    master_hmac = MASTER_HMAC.copy()
+    master_hmac.update(seed)
+    master = master_hmac.digest()
+    key, chain_code = master[:32], master[32:]
+
+    for index_bytes, needs_pubkey in DERIVATION_STEPS:
+        if needs_pubkey:
+            data = PublicKey.from_secret(key).format(compressed=True)
+        else:
+            data = b"\x00" + key
+        I = hmac.new(chain_code, data + index_bytes, hashlib.sha512).digest()
+        child = (int.from_bytes(I[:32], "big") + int.from_bytes(key, "big")) % SECP256K1_N
+        key, chain_code = child.to_bytes(32, "big"), I[32:]
+
+    # The seed and chain key are shared, each address only costs one more
+    # non-hardened CKDpriv step from the chain key
+    chain_pubkey = PublicKey.from_secret(key).format(compressed=True)
+    chain_key = int.from_bytes(key, "big")
+    chain_hmac = hmac.new(chain_code, digestmod=hashlib.sha512)
+    
+    addresses = []
+    for index_bytes in ADDRESS_INDEX_BYTES:
+        child_hmac = chain_hmac.copy()
+        child_hmac.update(chain_pubkey + index_bytes)
+        I = child_hmac.digest()
+        child = ((int.from_bytes(I[:32], "big") + chain_key) % SECP256K1_N).to_bytes(32, "big")
+        pubkey = PublicKey.from_secret(child).format(compressed=True)
+        addresses.append((base58check_encode(P2PKH_VERSION + hash160(pubkey)), child.hex()))
+    return addresses
+
+def generate_phrase(entropy):
+    """Build the 12-word BIP39 mnemonic for 16 bytes of entropy, as bytes"""
+    checksum = hashlib.sha256(entropy).digest()[0] >> 4
+    bits = int.from_bytes(entropy, "big") << 4 | checksum
+    return b" ".join([WORDLIST[(bits >> (11 * (11 - i))) & 0x7FF] for i in range(12)])
+
+def generate_addresses_from_phrase(phrase):
+    """Generate Bitcoin addresses and private keys from mnemonic phrase bytes"""
     try:
-        hdwallet = HDWallet(symbol=BTC)
-        hdwallet.from_mnemonic(phrase)
-        hdwallet.from_path(DERIVATION_PATH)
-        return hdwallet.p2pkh_address(), hdwallet.private_key()
+        return derive_p2pkh(phrase)
     except Exception as e:
-        log_error("ADDRESS_GENERATION_ERROR", f"Phrase: {phrase}, Error: {str(e)}")
-        return None, None
+        log_error("ADDRESS_GENERATION_ERROR", f"Phrase: {phrase.decode()}, Error: {str(e)}")
+        return []
+
+def init_worker():
+    """Pool worker setup: leave Ctrl+C handling to the main process"""
+    global _error_fh
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    # Each worker appends to its own shard, merged later by merge_shards.py
+    _error_fh = open(shard_path(ERROR_LOG_FILE, os.getpid()), "ab", buffering=LOG_BUFFER_SIZE)
+
+def generate_batch(entropies):
+    """Worker: derive (address, phrase, private_key, entropy, index) for a batch of entropies"""
+    wallets = []
+    for entropy in entropies:
+        phrase = generate_phrase(entropy)
+        for index, (address, private_key) in enumerate(generate_addresses_from_phrase(phrase)):
+            wallets.append((address, phrase.decode(), private_key, entropy.hex(), index))
+    
+    # Workers are terminated without running atexit, so don't hold errors back
+    _error_fh.flush()
+    return wallets
+
+def next_wallets(results):
+    """Wait for the next finished worker batch, None once the round is done"""
+    try:
+        return results.next(timeout=WORKER_POLL_TIMEOUT)
+    except StopIteration:
+        return None
 
 def get_spinner():
     """Get spinner iterator"""
@@ -132,100 +387,166 @@ def get_spinner():
 def save_cold_log(wallet_info, has_balance):
     """Save optimized wallet info to cold log"""
     try:
-        cold_data = {
-            "address": wallet_info["address"],
-            "phrase": wallet_info["phrase"],
-            "private_key": wallet_info["private_key"],
-            "has_balance": has_balance
-        }
-        with open(COLD_LOG_FILE, "a") as f:
-            f.write(json.dumps(cold_data) + "\n")
-            f.flush()
+        _cold_fh.write(COLD_RECORD.pack(
+            time.time(),
+            base58_decode(wallet_info["address"]),
+            bytes.fromhex(wallet_info["private_key"]),
+            bytes.fromhex(wallet_info["entropy"]),
+            wallet_info["index"],
+            has_balance
+        ))
     except Exception as e:
         log_error("COLD_LOG_ERROR", f"Failed to save cold log: {str(e)}", wallet_info)
 
-def main():
+def create_session():
+    """Create the HTTP session shared by all balance checks"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_SIZE,
+        limit_per_host=HTTP_POOL_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=REQUEST_TIMEOUT,
+        headers={"Accept-Encoding": "gzip"}
+    )
+
+async def process_batch(session, semaphore, funded_filter, batch, stats):
+    """Check balances for a batch of wallets and record the results"""
+    # Only addresses the filter can't rule out are worth an API call
+    if funded_filter is None:
+        candidates = batch
+    else:
+        candidates = [wallet_info for wallet_info in batch if wallet_info["address"] in funded_filter]
+    
+    balances = {}
+    if candidates:
+        async with semaphore:
+            for start in range(0, len(candidates), BALANCE_BATCH_SIZE):
+                balances.update(await check_balances(session, candidates[start:start + BALANCE_BATCH_SIZE]))
+    
+    for wallet_info in batch:
+        balance = balances.get(wallet_info["address"], 0)
+        has_balance = balance > 0
+        
+        # Save to cold log
+        save_cold_log(wallet_info, has_balance)
+        
+        if has_balance:
+            stats["found_with_balance"] += 1
+            print(f"\nFound address with balance!")
+            print(f"Address: {wallet_info['address']}")
+            print(f"Balance: {balance}")
+            print(f"Phrase: {wallet_info['phrase']}")
+            print(f"Private Key: {wallet_info['private_key']}")
+            print(f"Path: {DERIVATION_PATH}/{wallet_info['index']}")
+            
+            # Save to file
+            save_found_address(
+                wallet_info["address"],
+                balance,
+                wallet_info["phrase"],
+                wallet_info["private_key"],
+                f"{DERIVATION_PATH}/{wallet_info['index']}"
+            )
+
+async def main():
     print(f"Start generation at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Found addresses will be saved to: {FOUND_ADDRESSES_FILE}")
     print(f"Errors will be logged to: {ERROR_LOG_FILE}")
     print(f"Cold logs will be saved to: {COLD_LOG_FILE}")
     
-    mnemo = Mnemonic("english")
-    wordlist = mnemo.wordlist
+    check_secp256k1_backend()
+    open_log_files()
+    signal.signal(signal.SIGTERM, flush_logs_and_exit)
+    funded_filter = load_funded_filter()
+    if funded_filter is None:
+        print(f"No {FUNDED_ADDRESSES_FILE} snapshot found, checking every address online")
+    else:
+        print(f"Funded address filter loaded from: {FUNDED_ADDRESSES_FILE}")
     
-    total_generated = 0
-    found_with_balance = 0
-    error_count = 0
+    stats = {
+        "total_generated": 0,
+        "found_with_balance": 0,
+        "error_count": 0
+    }
     
     spinner = get_spinner()
+    last_render = 0.0
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(BALANCE_CONCURRENCY)
+    tasks = set()
     
     try:
-        while True:
-            # Generate random phrase
-            phrase = mnemo.generate(strength=128)
-            address, private_key = generate_address_from_phrase(phrase)
-            
-            if address:
-                total_generated += 1
-                
-                # Prepare wallet info for logging
-                wallet_info = {
-                    "address": address,
-                    "phrase": phrase,
-                    "private_key": private_key
-                }
-                
-                # Check balance
-                balance = check_balance(address, wallet_info=wallet_info)
-                has_balance = balance > 0
-                
-                # Save to cold log
-                save_cold_log(wallet_info, has_balance)
-                
-                if has_balance:
-                    found_with_balance += 1
-                    print(f"\nFound address with balance!")
-                    print(f"Address: {address}")
-                    print(f"Balance: {balance}")
-                    print(f"Phrase: {phrase}")
-                    print(f"Private Key: {private_key}")
+        # Spawned workers start clean instead of inheriting the main process's log buffers
+        with multiprocessing.get_context("spawn").Pool(processes=WORKER_COUNT, initializer=init_worker) as pool:
+            async with create_session() as session:
+                while True:
+                    # Don't let generation run ahead of the balance checkers
+                    while len(tasks) >= BALANCE_CONCURRENCY:
+                        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
                     
-                    # Save to file
-                    save_found_address(address, balance, phrase, private_key)
-                
-                # Update progress after each iteration
-                sys.stdout.write(f"\r{next(spinner)} Generating addresses... {total_generated} generated, {found_with_balance} with balance, {error_count} errors")
-                sys.stdout.flush()
-                
-                time.sleep(BALANCE_CHECK_INTERVAL)
+                    # Generate one batch of random entropy per worker process
+                    entropy_batches = [
+                        [secrets.token_bytes(16) for _ in range(BALANCE_BATCH_SIZE)]
+                        for _ in range(WORKER_COUNT)
+                    ]
+                    results = pool.imap_unordered(generate_batch, entropy_batches, chunksize=1)
+                    
+                    while True:
+                        try:
+                            wallets = await loop.run_in_executor(None, next_wallets, results)
+                        except multiprocessing.TimeoutError:
+                            continue
+                        if wallets is None:
+                            break
+                        
+                        batch = []
+                        for address, phrase, private_key, entropy, index in wallets:
+                            stats["total_generated"] += 1
+                            
+                            # Prepare wallet info for logging
+                            batch.append({
+                                "address": address,
+                                "phrase": phrase,
+                                "private_key": private_key,
+                                "entropy": entropy,
+                                "index": index
+                            })
+                        
+                        # Redraw progress at most once per STATUS_INTERVAL
+                        now = time.monotonic()
+                        if now - last_render > STATUS_INTERVAL:
+                            sys.stdout.write(f"\r{next(spinner)} Generating addresses... {stats['total_generated']} generated, {stats['found_with_balance']} with balance, {stats['error_count']} errors")
+                            sys.stdout.flush()
+                            last_render = now
+                        
+                        # Check balances concurrently while the next batch generates
+                        task = asyncio.create_task(process_batch(session, semaphore, funded_filter, batch, stats))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
                 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\nScan interrupted by user")
     except Exception as e:
         log_error("CRITICAL_ERROR", f"Main loop error: {str(e)}")
     finally:
         print(f"\nScan completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Total addresses generated: {total_generated}")
-        print(f"Addresses with balance: {found_with_balance}")
+        print(f"Total addresses generated: {stats['total_generated']}")
+        print(f"Addresses with balance: {stats['found_with_balance']}")
         print(f"Results saved to: {FOUND_ADDRESSES_FILE}")
         print(f"Errors logged to: {ERROR_LOG_FILE}")
         print(f"Cold logs saved to: {COLD_LOG_FILE}")
 
 if __name__ == "__main__":
-    if not os.path.exists(ERROR_LOG_FILE):
-        with open(ERROR_LOG_FILE, "w") as f:
-            f.write("")
-    if not os.path.exists(FOUND_ADDRESSES_FILE):
-        with open(FOUND_ADDRESSES_FILE, "w") as f:
-            f.write("")
-    if not os.path.exists(COLD_LOG_FILE):
-        with open(COLD_LOG_FILE, "w") as f:
-            f.write("")
-    
     # log_error("TEST", "TEST")
     # balance1 = check_balance("3Edf1tBMxUJUCMtnmAHza42z2ocjPKQGdu") # not empty
     # save_found_address("3Edf1tBMxUJUCMtnmAHza42z2ocjPKQGdu", balance1, "TEST")
     # balance2 = check_balance("1PMycacnJaSqwwJqjawXBErnLsZ7RkXUAs") # empty
     # save_found_address("1PMycacnJaSqwwJqjawXBErnLsZ7RkXUAs", balance2, "TEST")
     
-    main()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
@@ -0,0 +1,31 @@
+import os
+import re
+import sys
+from main import ERROR_LOG_FILE, COLD_LOG_FILE
+
+def find_shards(path):
+    """Find per-process shards of a log file, e.g. errors.1234.log"""
+    directory = os.path.dirname(path) or "."
+    root, ext = os.path.splitext(os.path.basename(path))
+    pattern = re.compile(rf"{re.escape(root)}\.\d+{re.escape(ext)}$")
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if pattern.match(name)
+    )
+
+def merge_shards(path):
+    """Append all shards of a log file to it and remove them"""
+    shards = find_shards(path)
+    with open(path, "ab") as out:
+        for shard in shards:
+            with open(shard, "rb") as f:
+                while chunk := f.read(1 << 20):
+                    out.write(chunk)
+            os.remove(shard)
+    return len(shards)
+
+if __name__ == "__main__":
+    # Run only while the scanner is stopped, shards are still being written otherwise
+    for path in sys.argv[1:] or [ERROR_LOG_FILE, COLD_LOG_FILE]:
+        print(f"{path}: merged {merge_shards(path)} shards")